@@ -44,11 +44,11 @@ def trigger_podcast():
             logger.info("✅ Podcast pull completed successfully")
             return jsonify(result), 200
         else:
-            logger.error(f"❌ Podcast pull failed: {result.get('error', 'Unknown error')}")
+            logger.error("❌ Podcast pull failed: %s", result.get('error', 'Unknown error'))
             return jsonify(result), 500
             
     except Exception as e:
-        logger.error(f"❌ API error: {str(e)}")
+        logger.error("❌ API error: %s", e)
         return jsonify({
             "success": False,
             "error": f"API error: {str(e)}"
@@ -6,6 +6,7 @@ This can be used with services like cron-job.org, EasyCron, etc.
 
 import os
 import subprocess
+import sys
 import json
 import logging
 from datetime import datetime
@@ -26,7 +27,7 @@ def trigger_podcast_pull(openai_key: str, max_episodes: int = 3) -> dict:
         dict: Result of the podcast pull operation
     """
     try:
-        logger.info(f"🤖 Starting automated podcast pull at {datetime.now()}")
+        logger.info("🤖 Starting automated podcast pull at %s", datetime.now())
         
         # Set up environment variables
         env = os.environ.copy()
@@ -48,7 +49,7 @@ def trigger_podcast_pull(openai_key: str, max_episodes: int = 3) -> dict:
             timeout=1800  # 30 minutes timeout
         )
         
-        logger.info(f"✅ Podcast pull completed with return code: {result.returncode}")
+        logger.info("✅ Podcast pull completed with return code: %s", result.returncode)
         
         return {
             "success": result.returncode == 0,
@@ -66,7 +67,7 @@ def trigger_podcast_pull(openai_key: str, max_episodes: int = 3) -> dict:
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
-        logger.error(f"❌ Podcast puller failed with error: {str(e)}")
+        logger.error("❌ Podcast puller failed with error: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -75,8 +76,6 @@ def trigger_podcast_pull(openai_key: str, max_episodes: int = 3) -> dict:
 
 def main():
     """Main function for testing the API trigger"""
-    import sys
-    
     if len(sys.argv) < 2:
         print("Usage: python api_trigger.py <OPENAI_API_KEY> [MAX_EPISODES]")
         sys.exit(1)
@@ -2,9 +2,39 @@
 import os
 from pathlib import Path
 
+from backend.core.storage import build_supabase_client
+
 # Project root (parent of backend/) so subprocess cwd finds backend package
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
+# Podcast config ids in pull order; KNOWN_CONFIG_IDS is for O(1) request validation
+PODCAST_CONFIG_IDS = ("apple", "second_podcast", "twiml", "practical_ai", "a16z", "cognitive_rev", "hard_fork", "lex_fridman", "dwarkesh", "nvidia_ai")
+KNOWN_CONFIG_IDS = frozenset(PODCAST_CONFIG_IDS)
+UNKNOWN_CONFIG_ID_DETAIL = "config_id must be one of the known podcasts (including lex_fridman, dwarkesh, nvidia_ai)"
+
+TRANSCRIPTS_TABLE_SECOND = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_SECOND_PODCAST", "latent_space_transcripts")
+TRANSCRIPTS_TABLE_TWIML = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_TWIML", "twiml_transcripts")
+TRANSCRIPTS_TABLE_PRACTICAL_AI = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_PRACTICAL_AI", "practical_ai_transcripts")
+TRANSCRIPTS_TABLE_A16Z = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_A16Z", "a16z_transcripts")
+TRANSCRIPTS_TABLE_COGNITIVE_REV = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_COGNITIVE_REV", "cognitive_revolution_transcripts")
+TRANSCRIPTS_TABLE_HARD_FORK = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_HARD_FORK", "hard_fork_transcripts")
+TRANSCRIPTS_TABLE_LEX_FRIDMAN = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_LEX_FRIDMAN", "lex_fridman_transcripts")
+TRANSCRIPTS_TABLE_DWARKESH = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_DWARKESH", "dwarkesh_transcripts")
+TRANSCRIPTS_TABLE_NVIDIA_AI = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_NVIDIA_AI", "nvidia_ai_transcripts")
+
+# Podcasts with their own transcripts table; the rest share podcast_transcripts, filtered by config_id
+TRANSCRIPT_TABLES = {
+    "second_podcast": TRANSCRIPTS_TABLE_SECOND,
+    "twiml": TRANSCRIPTS_TABLE_TWIML,
+    "practical_ai": TRANSCRIPTS_TABLE_PRACTICAL_AI,
+    "a16z": TRANSCRIPTS_TABLE_A16Z,
+    "cognitive_rev": TRANSCRIPTS_TABLE_COGNITIVE_REV,
+    "hard_fork": TRANSCRIPTS_TABLE_HARD_FORK,
+    "lex_fridman": TRANSCRIPTS_TABLE_LEX_FRIDMAN,
+    "dwarkesh": TRANSCRIPTS_TABLE_DWARKESH,
+    "nvidia_ai": TRANSCRIPTS_TABLE_NVIDIA_AI,
+}
+
 
 def get_supabase_credentials():
     url = os.getenv("SUPABASE_URL", "").strip()
@@ -14,6 +44,23 @@ def get_supabase_credentials():
     return url, key
 
 
+# (url, key) -> client, so API requests reuse one client and its connection pool
+_supabase_clients: dict = {}
+
+
+def get_supabase_client():
+    """Shared Supabase client for the API routers, or None when not configured."""
+    url, key = get_supabase_credentials()
+    if not url or not key:
+        return None
+    client = _supabase_clients.get((url, key))
+    if client is None:
+        client = build_supabase_client(url, key)
+        if client is not None:
+            _supabase_clients[(url, key)] = client
+    return client
+
+
 def get_openai_key():
     return (os.getenv("OPENAI_API_KEY") or "").strip()
 
@@ -4,7 +4,8 @@ import re
 import json
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, Tuple
+from functools import lru_cache
+from typing import Optional, List, Tuple, Dict
 
 import feedparser
 import requests
@@ -22,13 +23,17 @@ class Episode:
     position: int  # index position in the feed (0 = top)
 
 
+_SHOW_ID_RE = re.compile(r"id(\d+)")
+_EPISODE_ID_RE = re.compile(r"[?&]i=(\d+)")
+
+
 def extract_show_id_from_apple_url(url: str) -> Optional[str]:
-    match = re.search(r"id(\d+)", url)
+    match = _SHOW_ID_RE.search(url)
     return match.group(1) if match else None
 
 
 def extract_episode_id_from_apple_url(url: str) -> Optional[str]:
-    match = re.search(r"[?&]i=(\d+)", url)
+    match = _EPISODE_ID_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -137,7 +142,7 @@ def fetch_feed_xml(feed_url: str) -> str:
     return resp.text
 
 
-def _match_item_to_entry(item: "BeautifulSoup", entry: Episode) -> bool:
+def _item_keys(item: "BeautifulSoup") -> List[str]:
     guid_tag = item.find("guid")
     link_tag = item.find("link")
     enclosure_tag = item.find("enclosure")
@@ -146,22 +151,35 @@ def _match_item_to_entry(item: "BeautifulSoup", entry: Episode) -> bool:
     link_val = link_tag.text.strip() if link_tag and link_tag.text else None
     enclosure_val = enclosure_tag.get("url") if enclosure_tag else None
 
-    candidates = [c for c in [guid_val, link_val, enclosure_val] if c]
-    entry_values = {entry.guid, entry.link, entry.enclosure_url}
-    return any(c in entry_values for c in candidates)
+    return [c for c in [guid_val, link_val, enclosure_val] if c]
+
+
+@lru_cache(maxsize=4)
+def _feed_transcript_index(feed_xml: str) -> Dict[str, Tuple[str, Optional[str]]]:
+    """Parse the feed once and map each item's guid/link/enclosure URL to its transcript (url, type).
+
+    Every episode of a run looks up its transcript in the same feed, so lookups become
+    dict hits instead of a rescan of all <item> elements per episode.
+    """
+    index: Dict[str, Tuple[str, Optional[str]]] = {}
+    for item in BeautifulSoup(feed_xml, "xml").find_all("item"):
+        # Podcasting 2.0 transcript tag can be namespaced
+        t = item.find("podcast:transcript") or item.find("transcript")
+        if not t:
+            continue
+        url = t.get("url") or t.text.strip()
+        if not url:
+            continue
+        for key in _item_keys(item):
+            index.setdefault(key, (url, t.get("type")))
+    return index
 
 
 def find_transcript_for_entry(feed_xml: str, entry: Episode) -> Optional[Tuple[str, Optional[str]]]:
-    soup = BeautifulSoup(feed_xml, "xml")
-    for item in soup.find_all("item"):
-        if _match_item_to_entry(item, entry):
-            # Podcasting 2.0 transcript tag can be namespaced
-            t = item.find("podcast:transcript") or item.find("transcript")
-            if t:
-                url = t.get("url") or t.text.strip()
-                ttype = t.get("type")
-                if url:
-                    return url, ttype
+    index = _feed_transcript_index(feed_xml)
+    for value in (entry.guid, entry.link, entry.enclosure_url):
+        if value and value in index:
+            return index[value]
     return None
 
 
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 
 from dotenv import load_dotenv
 
+from .apple import extract_show_id_from_apple_url
+
 
 @dataclass
 class Config:
@@ -54,10 +56,7 @@ def load_config() -> Config:
     # Derive show_id either from env or from apple URL
     show_id = os.getenv("SHOW_ID")
     if not show_id and apple_episode_url:
-        import re
-        match = re.search(r"id(\d+)", apple_episode_url)
-        if match:
-            show_id = match.group(1)
+        show_id = extract_show_id_from_apple_url(apple_episode_url)
 
     # Limit processing per run (0 = unlimited)
     env_val = (os.getenv("MAX_EPISODES_PER_RUN", "") or "").strip()
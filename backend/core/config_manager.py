@@ -5,7 +5,6 @@ Configuration manager for storing and retrieving user settings in Supabase
 import os
 from typing import Optional, Dict, Any
 from datetime import datetime
-from .storage import build_supabase_client
 
 def save_user_config(
     supabase_client,
@@ -0,0 +1,24 @@
+"""ISO-8601 timestamp parsing shared by the pull pipeline and the API."""
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+
+# Results are immutable and the same timestamps recur across list refreshes and sorts
+@lru_cache(maxsize=4096)
+def parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp as stored in state files and Supabase; None if empty or unparseable.
+
+    A trailing Z is rewritten to +00:00 only when fromisoformat rejects it (Python < 3.11).
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        if not value.endswith("Z"):
+            return None
+    try:
+        return datetime.fromisoformat(value[:-1] + "+00:00")
+    except ValueError:
+        return None
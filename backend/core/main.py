@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import logging
 import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from .config import load_config
 from .apple import extract_show_id_from_apple_url, lookup_feed_url_via_itunes, parse_feed_entries, fetch_feed_xml, sort_episodes, extract_episode_id_from_apple_url, lookup_episode_release_and_show_id, lookup_episode_release_by_show_and_episode
@@ -12,10 +13,21 @@ from .transcripts import get_transcript_text
 from .posts import generate_linkedin_posts
 from .storage import StateStore, build_supabase_client, ensure_tables_exist, store_transcript, store_posts, load_processed_guids_and_latest_from_supabase
 from .config_manager import get_user_config
+from .dates import parse_iso
+
+
+def _read_text(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+_UNSAFE_FILENAME_RE = re.compile(r"[^a-zA-Z0-9._-]+")
 
 
 def _sanitize_filename(name: str) -> str:
-    return re.sub(r"[^a-zA-Z0-9._-]+", "_", name).strip("._") or "episode"
+    return _UNSAFE_FILENAME_RE.sub("_", name).strip("._") or "episode"
 
 
 def _find_episodes_to_process(episodes_sorted: List, starting_dt, state: StateStore, max_episodes: int, min_date=None) -> List:
@@ -35,9 +47,11 @@ def _find_episodes_to_process(episodes_sorted: List, starting_dt, state: StateSt
 
     if cutoff is not None:
         # Episodes newer than or equal to cutoff; already-pulled ones are skipped by GUID below
-        candidates = [e for e in episodes_sorted if e.published and e.published >= cutoff]
-        if min_date is not None:
-            candidates = [e for e in candidates if e.published >= min_date]
+        # One pass over the feed for both lower bounds
+        candidates = [
+            e for e in episodes_sorted
+            if e.published and e.published >= cutoff and (min_date is None or e.published >= min_date)
+        ]
         print(f"📊 Found {len(candidates)} episode(s) newer than cutoff")
     else:
         # First run, no state and no URL date: consider all (newest first)
@@ -228,11 +242,9 @@ def run() -> None:
     min_date = None
     min_date_str = (os.getenv("MIN_EPISODE_DATE") or "").strip()
     if min_date_str:
-        try:
-            min_date = datetime.fromisoformat(min_date_str.replace("Z", "+00:00"))
+        min_date = parse_iso(min_date_str)
+        if min_date is not None:
             print(f"📅 Using minimum episode date: {min_date.date().isoformat()}")
-        except ValueError:
-            pass
     episodes_to_process = _find_episodes_to_process(episodes_sorted, starting_dt, state, max_episodes, min_date)
 
     if not episodes_to_process:
@@ -240,79 +252,93 @@ def run() -> None:
         return
 
     processed_count = 0
-    for e in episodes_to_process:
-        print(f"Processing: {e.title}")
+    with ThreadPoolExecutor(max_workers=1) as uploader:
+        for e in episodes_to_process:
+            print(f"Processing: {e.title}")
 
-        try:
-            transcript_text = get_transcript_text(feed_xml, e, cfg.openai_api_key)
-        except Exception as ex:
-            print(f"  Failed to get transcript: {ex}")
-            continue
-
-        if not transcript_text or not transcript_text.strip():
-            print("  ⚠️ Transcript text is empty; skipping Supabase storage and state update for this episode.")
-            continue
-
-        # Save transcript using full episode title
-        base_name = _sanitize_filename(e.title)
-        transcript_path = cfg.transcripts_dir / f"{base_name}.txt"
-        transcript_path.write_text(transcript_text, encoding="utf-8")
-        print(f"  Transcript saved: {transcript_path}")
-
-        # Store transcript in Supabase table (second_podcast uses latent_space_transcripts)
-        if supabase_client is not None:
-            print(f"  📤 Supabase: Attempting to store transcript for '{e.title}'")
-            success = store_transcript(
-                supabase_client,
-                transcripts_table,
-                e.guid,
-                e.title,
-                e.published,
-                transcript_text,
-                config_id=None,
-            )
-            if success:
-                print(f"  ✅ Supabase: Transcript storage completed successfully")
+            try:
+                transcript_text = get_transcript_text(feed_xml, e, cfg.openai_api_key)
+            except Exception as ex:
+                print(f"  Failed to get transcript: {ex}")
+                continue
+
+            if not transcript_text or not transcript_text.strip():
+                print("  ⚠️ Transcript text is empty; skipping Supabase storage and state update for this episode.")
+                continue
+
+            # Save transcript using full episode title
+            base_name = _sanitize_filename(e.title)
+            transcript_path = cfg.transcripts_dir / f"{base_name}.txt"
+            # Same text as a previous run wrote: its drafts on disk are still valid, so skip the paid regeneration
+            transcript_unchanged = _read_text(transcript_path) == transcript_text
+            transcript_path.write_text(transcript_text, encoding="utf-8")
+            print(f"  Transcript saved: {transcript_path}")
+
+            # Store transcript in Supabase table (second_podcast uses latent_space_transcripts).
+            # Runs on the uploader thread so it overlaps with post generation below.
+            transcript_upload = None
+            if supabase_client is not None:
+                print(f"  📤 Supabase: Attempting to store transcript for '{e.title}'")
+                transcript_upload = uploader.submit(
+                    store_transcript,
+                    supabase_client,
+                    transcripts_table,
+                    e.guid,
+                    e.title,
+                    e.published,
+                    transcript_text,
+                    config_id=None,
+                )
             else:
-                print(f"  ❌ Supabase: Transcript storage failed")
-        else:
-            print(f"  ⏭️ Supabase: Skipping transcript storage (client not available)")
+                print(f"  ⏭️ Supabase: Skipping transcript storage (client not available)")
 
-        # Generate posts if OpenAI configured
-        if cfg.openai_api_key:
-            try:
-                posts_list = generate_linkedin_posts(cfg.openai_api_key, transcript_text, e.title)
-                if posts_list:
+            # Generate posts if OpenAI configured
+            if cfg.openai_api_key:
+                try:
                     posts_path = cfg.posts_dir / f"{base_name}.md"
-                    posts_content = "\n\n---\n\n".join(posts_list)
-                    posts_path.write_text(posts_content, encoding="utf-8")
-                    print(f"  LinkedIn drafts saved: {posts_path}")
-                    if supabase_client is not None:
-                        print(f"  📤 Supabase: Attempting to store posts for '{e.title}'")
-                        success = store_posts(
-                            supabase_client,
-                            cfg.supabase_table_posts,
-                            e.guid,
-                            e.title,
-                            e.published,
-                            posts_content
-                        )
-                        if success:
-                            print(f"  ✅ Supabase: Posts storage completed successfully")
-                        else:
-                            print(f"  ❌ Supabase: Posts storage failed")
+                    posts_content = _read_text(posts_path) if transcript_unchanged else None
+                    if posts_content:
+                        print(f"  ♻️ Reusing LinkedIn drafts for unchanged transcript: {posts_path}")
                     else:
-                        print(f"  ⏭️ Supabase: Skipping posts storage (client not available)")
-            except Exception as ex:
-                print(f"  Failed to generate posts: {ex}")
-        else:
-            print("  OPENAI_API_KEY not set; skipping LinkedIn draft generation.")
+                        posts_list = generate_linkedin_posts(cfg.openai_api_key, transcript_text, e.title)
+                        if posts_list:
+                            posts_content = "\n\n---\n\n".join(posts_list)
+                            posts_path.write_text(posts_content, encoding="utf-8")
+                            print(f"  LinkedIn drafts saved: {posts_path}")
+                    if posts_content:
+                        if supabase_client is not None:
+                            print(f"  📤 Supabase: Attempting to store posts for '{e.title}'")
+                            success = store_posts(
+                                supabase_client,
+                                cfg.supabase_table_posts,
+                                e.guid,
+                                e.title,
+                                e.published,
+                                posts_content
+                            )
+                            if success:
+                                print(f"  ✅ Supabase: Posts storage completed successfully")
+                            else:
+                                print(f"  ❌ Supabase: Posts storage failed")
+                        else:
+                            print(f"  ⏭️ Supabase: Skipping posts storage (client not available)")
+                except Exception as ex:
+                    print(f"  Failed to generate posts: {ex}")
+            else:
+                print("  OPENAI_API_KEY not set; skipping LinkedIn draft generation.")
+
+            if transcript_upload is not None:
+                if transcript_upload.result():
+                    print(f"  ✅ Supabase: Transcript storage completed successfully")
+                else:
+                    print(f"  ❌ Supabase: Transcript storage failed")
 
-        state.mark_processed(e.guid, e.published)
-        processed_count += 1
+            state.mark_processed(e.guid, e.published)
+            processed_count += 1
 
     print(f"Processed {processed_count} new episode(s).")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING").upper())
     run()
@@ -1,19 +1,18 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List
 
 from openai import OpenAI
 
 
-def generate_linkedin_posts(openai_api_key: str, transcript_text: str, episode_title: str) -> List[str]:
-    client = OpenAI(api_key=openai_api_key)
-
-    system_msg = (
-        "You are a social media editor who turns transcripts into concise, high-signal LinkedIn posts. "
-        "Focus on practical takeaways, use a strong hook, and avoid emojis."
-    )
+_SYSTEM_MSG = (
+    "You are a social media editor who turns transcripts into concise, high-signal LinkedIn posts. "
+    "Focus on practical takeaways, use a strong hook, and avoid emojis."
+)
 
-    user_prompt = f"""
+# Filled with format_map; braces inside the transcript are safe since only the template is parsed
+_USER_PROMPT_TMPL = """
 Transcribe summary into three distinct LinkedIn-ready posts.
 Constraints:
 - Each post: 100-180 words, strong hook, 1-2 short paragraphs, skimmable bullets only if essential.
@@ -22,15 +21,27 @@ Constraints:
 
 Episode title: {episode_title}
 Transcript:
-{transcript_text[:8000]}
+{transcript}
 
 Return exactly three posts, separated by a line with three dashes (---) and nothing else.
 """
 
+
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str) -> OpenAI:
+    """One client (and connection pool) per key, reused across episodes in a pull run."""
+    return OpenAI(api_key=api_key)
+
+
+def generate_linkedin_posts(openai_api_key: str, transcript_text: str, episode_title: str) -> List[str]:
+    client = _openai_client(openai_api_key)
+
+    user_prompt = _USER_PROMPT_TMPL.format_map({"episode_title": episode_title, "transcript": transcript_text[:8000]})
+
     completion = client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[
-            {"role": "system", "content": system_msg},
+            {"role": "system", "content": _SYSTEM_MSG},
             {"role": "user", "content": user_prompt},
         ],
         temperature=0.7,
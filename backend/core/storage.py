@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import json
+import logging
 import sys
+import traceback
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Set, Dict, Any, Tuple
 
+from .dates import parse_iso
+
+logger = logging.getLogger(__name__)
+
 
 def _log(msg: str) -> None:
     """Print without UnicodeEncodeError on Windows (cp1252)."""
@@ -24,16 +30,18 @@ class StateStore:
         self._load()
 
     def _load(self) -> None:
-        if self.state_file.exists():
-            try:
-                data = json.loads(self.state_file.read_text(encoding="utf-8"))
-                guids = data.get("processed_guids", [])
-                if isinstance(guids, list):
-                    self.processed_guids = set(str(g) for g in guids)
-                self.latest_published_iso = data.get("latest_published_iso")
-            except Exception:
-                self.processed_guids = set()
-                self.latest_published_iso = None
+        # Read directly instead of exists() + read: one filesystem call on the common path
+        try:
+            data = json.loads(self.state_file.read_text(encoding="utf-8"))
+            guids = data.get("processed_guids", [])
+            if isinstance(guids, list):
+                self.processed_guids = set(str(g) for g in guids)
+            self.latest_published_iso = data.get("latest_published_iso")
+        except FileNotFoundError:
+            return
+        except Exception:
+            self.processed_guids = set()
+            self.latest_published_iso = None
 
     def _save(self) -> None:
         data = {
@@ -46,18 +54,14 @@ class StateStore:
         return guid in self.processed_guids
 
     def get_latest_published(self) -> Optional[datetime]:
-        if not self.latest_published_iso:
-            return None
-        try:
-            dt = datetime.fromisoformat(self.latest_published_iso.replace("Z", "+00:00"))
-            # Return naive so it compares with feed dates (feedparser gives naive UTC)
-            if dt.tzinfo is not None:
-                dt = dt.replace(tzinfo=None)
-            return dt
-        except Exception:
-            return None
+        dt = parse_iso(self.latest_published_iso)
+        # Return naive so it compares with feed dates (feedparser gives naive UTC)
+        if dt is not None and dt.tzinfo is not None:
+            dt = dt.replace(tzinfo=None)
+        return dt
 
     def mark_processed(self, guid: str, published: Optional[datetime]) -> None:
+        changed = guid not in self.processed_guids
         self.processed_guids.add(guid)
         # Update the latest published if newer
         if published is not None:
@@ -65,7 +69,10 @@ class StateStore:
             if current is None or published > current:
                 # Store as ISO without timezone (naive local time)
                 self.latest_published_iso = published.isoformat()
-        self._save()
+                changed = True
+        # Re-processing a known episode leaves the state as it was; skip rewriting the file
+        if changed:
+            self._save()
 
 
 # ----------------------- Supabase helpers -----------------------
@@ -83,13 +90,11 @@ def build_supabase_client(url: Optional[str], key: Optional[str]):
         _log("  [Supabase] missing SUPABASE_URL or key; skipping uploads")
         return None
     
-    _log(f"  [Supabase] URL: {url}")
-    _log(f"  [Supabase] Key: {key[:10]}... (length: {len(key)})")
+    logger.debug("[Supabase] URL: %s", url)
+    logger.debug("[Supabase] Key length: %d", len(key))
     
     try:
-        _log("  [Supabase] Importing supabase client...")
         from supabase import create_client
-        _log("  [Supabase] Client imported successfully")
     except Exception as ex:
         _log(f"  [Supabase] failed to import client: {ex}")
         return None
@@ -102,7 +107,6 @@ def build_supabase_client(url: Optional[str], key: Optional[str]):
     except Exception as ex:
         _log(f"  [Supabase] failed to initialize client: {ex}")
         _log(f"  [Supabase] Error type: {type(ex).__name__}")
-        import traceback
         _log(f"  [Supabase] Traceback: {traceback.format_exc()}")
         return None
 
@@ -124,10 +128,19 @@ def ensure_tables_exist(client) -> None:
         _log(f"  [Supabase] tables may not exist or are not accessible: {ex}")
         _log(f"  [Supabase] Error type: {type(ex).__name__}")
         _log("  [Supabase] Please run the SQL schema to create the required tables")
-        import traceback
         _log(f"  [Supabase] Traceback: {traceback.format_exc()}")
 
 
+def count_rows(client, table: str) -> int:
+    """Return the row count of a Supabase table without transferring the rows.
+
+    PostgREST reports the exact total in the Content-Range header; we only ask for
+    the id column and a single row so the response body stays tiny.
+    """
+    resp = client.table(table).select("id", count="exact").limit(1).execute()
+    return resp.count or 0
+
+
 def load_processed_guids_from_supabase(client, table: str = "podcast_transcripts", config_id: Optional[str] = None) -> Set[str]:
     """Load processed episode GUIDs from Supabase for one podcast (or all if config_id is None).
     
@@ -255,10 +268,12 @@ def _chunk_content(content: str, max_size: int = 20_000_000) -> list[str]:
 def store_transcript(client, table: str, guid: str, title: str, published_at: Optional[datetime], content: str, config_id: Optional[str] = None) -> bool:
     """Store transcript content directly in Supabase table. Returns True on success."""
     try:
-        _log(f"  [Supabase] Preparing to store transcript for '{title}'")
-        _log(f"  [Supabase] GUID: {guid}")
-        _log(f"  [Supabase] Published: {published_at.isoformat() if published_at else 'None'}")
-        _log(f"  [Supabase] Content length: {len(content)} characters")
+        _log(
+            f"  [Supabase] Preparing to store transcript for '{title}'\n"
+            f"  [Supabase] GUID: {guid}\n"
+            f"  [Supabase] Published: {published_at.isoformat() if published_at else 'None'}\n"
+            f"  [Supabase] Content length: {len(content)} characters"
+        )
         
         # Check if content needs chunking
         MAX_CONTENT_SIZE = 20_000_000  # 20MB to be safe
@@ -307,8 +322,8 @@ def store_transcript(client, table: str, guid: str, title: str, published_at: Op
             _log(f"  [Supabase] Sending upsert request to table '{table}'")
             resp = client.table(table).upsert(row, on_conflict="guid").execute()
             
-            _log(f"  [Supabase] Response status: {getattr(resp, 'status_code', 'Unknown')}")
-            _log(f"  [Supabase] Response data: {getattr(resp, 'data', 'No data')}")
+            logger.debug("[Supabase] Response status: %s", getattr(resp, "status_code", "Unknown"))
+            logger.debug("[Supabase] Response data: %s", getattr(resp, "data", "No data"))
             
             if getattr(resp, "data", None) is not None or getattr(resp, "status_code", 200) in (200, 201):
                 _log(f"  [Supabase] Successfully stored transcript for '{title}'")
@@ -319,7 +334,6 @@ def store_transcript(client, table: str, guid: str, title: str, published_at: Op
     except Exception as ex:
         _log(f"  [Supabase] transcript storage failed: {ex}")
         _log(f"  [Supabase] Error type: {type(ex).__name__}")
-        import traceback
         _log(f"  [Supabase] Traceback: {traceback.format_exc()}")
     return False
 
@@ -327,11 +341,13 @@ def store_transcript(client, table: str, guid: str, title: str, published_at: Op
 def store_posts(client, table: str, guid: str, title: str, published_at: Optional[datetime], content: str, post_type: str = "linkedin") -> bool:
     """Store posts content directly in Supabase table. Returns True on success."""
     try:
-        _log(f"  [Supabase] Preparing to store posts for '{title}'")
-        _log(f"  [Supabase] GUID: {guid}")
-        _log(f"  [Supabase] Published: {published_at if published_at else 'None'}")
-        _log(f"  [Supabase] Post Type: {post_type}")
-        _log(f"  [Supabase] Content length: {len(content)} characters")
+        _log(
+            f"  [Supabase] Preparing to store posts for '{title}'\n"
+            f"  [Supabase] GUID: {guid}\n"
+            f"  [Supabase] Published: {published_at if published_at else 'None'}\n"
+            f"  [Supabase] Post Type: {post_type}\n"
+            f"  [Supabase] Content length: {len(content)} characters"
+        )
         
         # Check if content is too large (Supabase limit is ~26MB)
         MAX_CONTENT_SIZE = 25_000_000  # 25MB to be safe
@@ -361,13 +377,13 @@ def store_posts(client, table: str, guid: str, title: str, published_at: Optiona
         }
         
         _log(f"  [Supabase] Sending upsert request to table '{table}'")
-        _log(f"  [Supabase] Row data: {row}")
+        logger.debug("[Supabase] Row data: %s", row)
         
         # Use upsert to handle duplicates (update if exists, insert if new)
         try:
             resp = client.table(table).upsert(row, on_conflict="guid").execute()
             _log(f"  [Supabase] Upsert successful")
-            _log(f"  [Supabase] Response data: {getattr(resp, 'data', 'No data')}")
+            logger.debug("[Supabase] Response data: %s", getattr(resp, "data", "No data"))
             _log(f"  [Supabase] Successfully stored posts for '{title}'")
             return True
         except Exception as upsert_error:
@@ -376,7 +392,6 @@ def store_posts(client, table: str, guid: str, title: str, published_at: Optiona
     except Exception as ex:
         _log(f"  [Supabase] posts storage failed: {ex}")
         _log(f"  [Supabase] Error type: {type(ex).__name__}")
-        import traceback
         _log(f"  [Supabase] Traceback: {traceback.format_exc()}")
     return False
 
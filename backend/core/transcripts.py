@@ -3,7 +3,10 @@ from __future__ import annotations
 import json
 import os
 import re
+import shutil
+import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from uuid import uuid4
 from typing import Optional, Tuple
 
@@ -13,10 +16,14 @@ from openai import OpenAI
 
 from .apple import Episode, find_transcript_for_entry
 
+# Whisper requests in flight at once when a long episode is split into chunks
+WHISPER_CONCURRENCY = int(os.getenv("WHISPER_CONCURRENCY", "4"))
+# Retries per Whisper request on rate limits, timeouts and 5xx; the OpenAI client backs off between them
+WHISPER_MAX_RETRIES = 3
+
 
 def _find_ffmpeg() -> Tuple[str, str]:
     """Return (ffmpeg_exe, ffprobe_exe). Uses PATH, or FFMPEG_PATH env (folder or full path to ffmpeg)."""
-    import shutil
     ext = ".exe" if os.name == "nt" else ""
     path_env = os.environ.get("FFMPEG_PATH", "").strip()
     if path_env:
@@ -31,14 +38,15 @@ def _find_ffmpeg() -> Tuple[str, str]:
     return (shutil.which("ffmpeg") or "ffmpeg", shutil.which("ffprobe") or "ffprobe")
 
 
+_SRT_INDEX_RE = re.compile(r"^\d+$")
+_SRT_TIMING_RE = re.compile(r"^\d{2}:\d{2}:\d{2},\d{3} --> ")
+
+
 def _strip_srt(srt_text: str) -> str:
     lines = []
     for line in srt_text.splitlines():
-        if re.match(r"^\d+$", line.strip()):
-            continue
-        if re.match(r"^\d{2}:\d{2}:\d{2},\d{3} --> ", line):
-            continue
-        if line.strip() == "":
+        stripped = line.strip()
+        if not stripped or _SRT_INDEX_RE.match(stripped) or _SRT_TIMING_RE.match(line):
             continue
         lines.append(line)
     return "\n".join(lines)
@@ -66,13 +74,13 @@ def _fetch_text_from_url(url: str) -> str:
             data = resp.json()
             if isinstance(data, dict):
                 if "results" in data and isinstance(data["results"], list):
-                    return "\n".join([seg.get("text", "").strip() for seg in data["results"] if seg.get("text")])
+                    return "\n".join(seg.get("text", "").strip() for seg in data["results"] if seg.get("text"))
                 if "segments" in data and isinstance(data["segments"], list):
-                    return "\n".join([seg.get("text", "").strip() for seg in data["segments"] if seg.get("text")])
+                    return "\n".join(seg.get("text", "").strip() for seg in data["segments"] if seg.get("text"))
                 if "text" in data and isinstance(data["text"], str):
                     return data["text"].strip()
             if isinstance(data, list):
-                return "\n".join([str(x) for x in data])
+                return "\n".join(map(str, data))
             return json.dumps(data)
         except Exception as e:
             raise RuntimeError(f"Failed to parse JSON transcript: {e}")
@@ -103,11 +111,6 @@ def _is_likely_audio(file_path: str) -> bool:
 
 
 def _split_audio_file(input_path: str, chunk_duration_minutes: int = 15) -> list[str]:
-    try:
-        import subprocess
-    except ImportError:
-        raise RuntimeError("ffmpeg not available for audio splitting")
-
     ffmpeg_exe, ffprobe_exe = _find_ffmpeg()
     if not os.path.isfile(ffmpeg_exe) and ffmpeg_exe == "ffmpeg":
         try:
@@ -196,6 +199,27 @@ def _split_audio_file(input_path: str, chunk_duration_minutes: int = 15) -> list
     return chunk_paths
 
 
+def _transcribe_chunk(client: OpenAI, i: int, total: int, chunk_path: str) -> str:
+    """Whisper text for one split chunk. Raises once the client's own retries are exhausted,
+    so a chunk is never silently left out of the episode transcript."""
+    print(f"  🎤 Transcribing chunk {i+1}/{total}...")
+    try:
+        with open(chunk_path, "rb") as f:
+            result = client.audio.transcriptions.create(model="whisper-1", file=f)
+    except Exception as e:
+        err_msg = getattr(e, "message", str(e)) or repr(e)
+        if hasattr(e, "response") and getattr(e.response, "text", None):
+            err_msg = f"{err_msg} | {e.response.text[:200]}"
+        print(f"  ❌ Failed to transcribe chunk {i+1}: {err_msg}")
+        raise RuntimeError(f"Chunk {i+1}/{total} failed transcription: {err_msg}") from e
+    chunk_text = (getattr(result, "text", "") or "").strip()
+    if chunk_text:
+        print(f"  ✅ Chunk {i+1} transcribed ({len(chunk_text)} chars)")
+    else:
+        print(f"  ⚠️ Chunk {i+1} produced empty transcript")
+    return chunk_text
+
+
 def transcribe_via_openai_whisper(audio_url: str, api_key: Optional[str] = None) -> str:
     file_size = None
     try:
@@ -233,7 +257,7 @@ def transcribe_via_openai_whisper(audio_url: str, api_key: Optional[str] = None)
             raise RuntimeError("OpenAI API key not provided")
 
         with httpx.Client(timeout=120.0) as http_client:
-            client = OpenAI(api_key=api_key_to_use, http_client=http_client)
+            client = OpenAI(api_key=api_key_to_use, http_client=http_client, max_retries=WHISPER_MAX_RETRIES)
 
             if downloaded_size > 20_000_000:
                 print(f"  🔄 File too large ({downloaded_size/1024/1024:.1f}MB), splitting into chunks...")
@@ -241,38 +265,35 @@ def transcribe_via_openai_whisper(audio_url: str, api_key: Optional[str] = None)
                 if not chunk_paths:
                     return ""
 
-                all_transcripts = []
-                for i, chunk_path in enumerate(chunk_paths):
-                    print(f"  🎤 Transcribing chunk {i+1}/{len(chunk_paths)}...")
-                    try:
-                        with open(chunk_path, "rb") as f:
-                            result = client.audio.transcriptions.create(model="whisper-1", file=f)
-                        chunk_text = getattr(result, "text", "") or ""
-                        if chunk_text.strip():
-                            all_transcripts.append(chunk_text.strip())
-                            print(f"  ✅ Chunk {i+1} transcribed ({len(chunk_text)} chars)")
-                        else:
-                            print(f"  ⚠️ Chunk {i+1} produced empty transcript")
-                    except Exception as e:
-                        err_msg = getattr(e, "message", str(e)) or repr(e)
-                        if hasattr(e, "response") and getattr(e.response, "text", None):
-                            err_msg = f"{err_msg} | {e.response.text[:200]}"
-                        print(f"  ❌ Failed to transcribe chunk {i+1}: {err_msg}")
-                        continue
-
-                for chunk_path in chunk_paths:
-                    try:
-                        if os.path.exists(chunk_path):
-                            os.remove(chunk_path)
-                    except Exception:
-                        pass
+                # Chunks are independent requests, so transcribe a few at once and put the texts back in chunk order.
+                # Any chunk that still fails after retries raises, failing the episode rather than storing a gapped transcript.
+                pool = ThreadPoolExecutor(max_workers=max(1, min(WHISPER_CONCURRENCY, len(chunk_paths))))
+                try:
+                    futures = {
+                        pool.submit(_transcribe_chunk, client, i, len(chunk_paths), chunk_path): i
+                        for i, chunk_path in enumerate(chunk_paths)
+                    }
+                    texts = [""] * len(chunk_paths)
+                    for future in as_completed(futures):
+                        texts[futures[future]] = future.result()
+                    all_transcripts = [t for t in texts if t]
+                finally:
+                    # After a failed chunk, chunks not yet started are cancelled rather than paid for;
+                    # in-flight ones are waited for so their files can be removed below
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    for chunk_path in chunk_paths:
+                        try:
+                            if os.path.exists(chunk_path):
+                                os.remove(chunk_path)
+                        except Exception:
+                            pass
 
                 if all_transcripts:
                     combined_transcript = " ".join(all_transcripts)
                     print(f"  ✅ Combined transcription completed ({len(combined_transcript)} chars)")
                     return combined_transcript
                 else:
-                    raise RuntimeError("All audio chunks failed transcription")
+                    raise RuntimeError("All audio chunks produced empty transcripts")
 
             else:
                 print(f"  🎤 Transcribing with Whisper...")
@@ -4,6 +4,7 @@ Run: uvicorn backend.main:app --reload --host 0.0.0.0 --port 8000
 
 Optional: set PULL_LATEST_ON_STARTUP=1 to pull newest episodes for all podcasts when the server starts.
 """
+import logging
 import os
 import sys
 import subprocess
@@ -22,6 +23,9 @@ except Exception:
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+# Debug output (Supabase row/response dumps) is only formatted when LOGLEVEL=DEBUG
+logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING").upper())
+
 scheduler = BackgroundScheduler()
 
 
@@ -40,7 +44,7 @@ def run_pull_script():
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.routers import auth, config, pull, transcripts, posts, health
+from backend.routers import auth, config, pull, transcripts, posts, health, stats
 
 app = FastAPI(
     title="Podcast AI Studio API",
@@ -62,6 +66,7 @@ app.include_router(config.router, prefix="/api/config", tags=["config"])
 app.include_router(pull.router, prefix="/api/pull", tags=["pull"])
 app.include_router(transcripts.router, prefix="/api/transcripts", tags=["transcripts"])
 app.include_router(posts.router, prefix="/api/posts", tags=["posts"])
+app.include_router(stats.router, prefix="/api/stats", tags=["stats"])
 
 
 @app.on_event("startup")
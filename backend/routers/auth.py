@@ -1,4 +1,5 @@
 import hashlib
+import hmac
 import time
 from fastapi import APIRouter, HTTPException, Depends, Header
 from pydantic import BaseModel
@@ -28,6 +29,21 @@ def _hash_password(password: str) -> str:
     return hashlib.sha256(password.encode()).hexdigest()
 
 
+def _verify_password(password: str, stored_hash: str) -> bool:
+    """Check password against ADMIN_PASSWORD_HASH: an argon2 hash ($argon2id$...) or a legacy SHA-256 hex digest."""
+    if not stored_hash.startswith("$argon2"):
+        return hmac.compare_digest(_hash_password(password).encode(), stored_hash.encode())
+    try:
+        from argon2 import PasswordHasher
+        from argon2.exceptions import InvalidHashError, VerificationError
+    except ImportError:
+        raise HTTPException(status_code=503, detail="argon2-cffi not installed")
+    try:
+        return PasswordHasher().verify(stored_hash, password)
+    except (InvalidHashError, VerificationError):
+        return False
+
+
 @router.post("/login", response_model=LoginResponse)
 def login(body: LoginRequest):
     """Validate admin credentials. Returns a token for Authorization: Bearer <token>."""
@@ -36,7 +52,7 @@ def login(body: LoginRequest):
     stored_hash = get_admin_password_hash()
     if not stored_hash:
         raise HTTPException(status_code=503, detail="ADMIN_PASSWORD_HASH not configured")
-    if _hash_password(body.password) != stored_hash:
+    if not _verify_password(body.password, stored_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     token = hashlib.sha256((body.password + str(time.time()) + "podcast-ai-studio").encode()).hexdigest()
     _valid_tokens[token] = time.time() + TOKEN_TTL_SEC
@@ -47,10 +63,10 @@ def require_auth(authorization: Optional[str] = Header(None)) -> str:
     """Dependency: require valid Bearer token."""
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Missing or invalid Authorization header")
-    token = authorization.replace("Bearer ", "").strip()
-    now = time.time()
-    if token not in _valid_tokens or _valid_tokens[token] < now:
-        if token in _valid_tokens:
-            del _valid_tokens[token]
+    token = authorization[len("Bearer "):].strip()
+    # Runs on every API call: one dict lookup instead of up to four
+    expiry = _valid_tokens.get(token)
+    if expiry is None or expiry < time.time():
+        _valid_tokens.pop(token, None)
         raise HTTPException(status_code=401, detail="Invalid or expired token")
     return token
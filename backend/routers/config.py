@@ -2,7 +2,8 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import Optional
 
-from backend.config import get_supabase_credentials
+from backend.config import KNOWN_CONFIG_IDS, UNKNOWN_CONFIG_ID_DETAIL, get_supabase_client
+from backend.core.config_manager import get_user_config, save_user_config
 from backend.routers.auth import require_auth
 
 router = APIRouter()
@@ -14,20 +15,12 @@ class ConfigBody(BaseModel):
     max_episodes_per_run: int = 10
 
 
-def _supabase_client():
-    url, key = get_supabase_credentials()
-    if not url or not key:
-        return None
-    from backend.core.storage import build_supabase_client
-    return build_supabase_client(url, key)
-
-
 @router.get("/{config_id}")
 def get_config(config_id: str, _: str = Depends(require_auth)):
     """Get podcast config for apple, second_podcast, or twiml. Returns defaults when missing so UI never fails."""
-    if config_id not in ("apple", "second_podcast", "twiml", "practical_ai", "a16z", "cognitive_rev", "hard_fork", "lex_fridman", "dwarkesh", "nvidia_ai"):
-        raise HTTPException(status_code=400, detail="config_id must be one of the known podcasts (including lex_fridman, dwarkesh, nvidia_ai)")
-    client = _supabase_client()
+    if config_id not in KNOWN_CONFIG_IDS:
+        raise HTTPException(status_code=400, detail=UNKNOWN_CONFIG_ID_DETAIL)
+    client = get_supabase_client()
     if not client:
         # Return defaults instead of 503 so Latent Space tab can still show transcripts
         return {
@@ -36,7 +29,6 @@ def get_config(config_id: str, _: str = Depends(require_auth)):
             "max_episodes_per_run": 10,
         }
     try:
-        from backend.core.config_manager import get_user_config
         data = get_user_config(client, config_id=config_id) or {}
     except Exception:
         data = {}
@@ -54,12 +46,11 @@ def get_config(config_id: str, _: str = Depends(require_auth)):
 @router.put("/{config_id}")
 def put_config(config_id: str, body: ConfigBody, _: str = Depends(require_auth)):
     """Save podcast config."""
-    if config_id not in ("apple", "second_podcast", "twiml", "practical_ai", "a16z", "cognitive_rev", "hard_fork", "lex_fridman", "dwarkesh", "nvidia_ai"):
-        raise HTTPException(status_code=400, detail="config_id must be one of the known podcasts (including lex_fridman, dwarkesh, nvidia_ai)")
-    client = _supabase_client()
+    if config_id not in KNOWN_CONFIG_IDS:
+        raise HTTPException(status_code=400, detail=UNKNOWN_CONFIG_ID_DETAIL)
+    client = get_supabase_client()
     if not client:
         raise HTTPException(status_code=503, detail="Supabase not configured")
-    from backend.core.config_manager import save_user_config
     ok = save_user_config(
         client,
         show_id=body.show_id.strip(),
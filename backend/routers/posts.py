@@ -1,38 +1,73 @@
-from fastapi import APIRouter, Depends
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from backend.config import get_supabase_credentials
+from fastapi import APIRouter, Depends, Query
+
+from backend.config import get_supabase_client
 from backend.routers.auth import require_auth
 
 router = APIRouter()
 
+# Columns the dashboard's Post model reads; the rest of each row is never sent to the client
+POST_COLUMNS = "id, guid, title, published_at, posts_content, post_type, created_at"
+POSTS_CACHE_TTL = int(os.getenv("POSTS_CACHE_TTL", "60"))
 
-def _load_posts():
-    url, key = get_supabase_credentials()
-    if not url or not key:
+# "entry" -> (expires_at, posts), replaced as one tuple so a reader never pairs a fresh
+# expiry with cleared posts; cleared by the pull router after a run. "generation" is bumped
+# by every clear, and a load stores its result only if no clear ran while it was in flight.
+_posts_cache: dict = {"entry": (0.0, []), "generation": 0}
+_posts_cache_lock = threading.Lock()
+
+
+def clear_posts_cache():
+    with _posts_cache_lock:
+        _posts_cache["entry"] = (0.0, [])
+        _posts_cache["generation"] += 1
+
+
+def _select_posts(client, table: str):
+    try:
+        r = client.table(table).select(POST_COLUMNS).order("created_at", desc=True).execute()
+        return r.data or []
+    except Exception:
         return []
-    from backend.core.storage import build_supabase_client
-    client = build_supabase_client(url, key)
+
+
+def _load_posts():
+    client = get_supabase_client()
     if not client:
         return []
     all_posts = []
-    for table in ("linkedin_posts", "blog_posts"):
-        try:
-            r = client.table(table).select("*").order("created_at", desc=True).execute()
-            if r.data:
-                all_posts.extend(r.data)
-        except Exception:
-            pass
+    # Both tables are independent, so fetch them concurrently (one round-trip of latency instead of two)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        for rows in pool.map(lambda table: _select_posts(client, table), ("linkedin_posts", "blog_posts")):
+            all_posts.extend(rows)
     if not all_posts:
-        try:
-            r = client.table("podcast_posts").select("*").order("created_at", desc=True).execute()
-            if r.data:
-                all_posts.extend(r.data)
-        except Exception:
-            pass
+        all_posts = _select_posts(client, "podcast_posts")
     return all_posts
 
 
+def _cached_posts(refresh: bool = False):
+    """Posts from the last load for up to POSTS_CACHE_TTL seconds. An empty load is not kept, so the next request tries again."""
+    now = time.monotonic()
+    with _posts_cache_lock:
+        expires_at, posts = _posts_cache["entry"]
+        generation = _posts_cache["generation"]
+    if not refresh and expires_at > now:
+        return posts
+    posts = _load_posts()
+    with _posts_cache_lock:
+        if _posts_cache["generation"] == generation:
+            _posts_cache["entry"] = (now + POSTS_CACHE_TTL, posts) if posts else (0.0, [])
+    return posts
+
+
 @router.get("")
-def list_posts(_: str = Depends(require_auth)):
-    """List all posts (LinkedIn + blog)."""
-    return _load_posts()
+def list_posts(
+    refresh: bool = Query(False),
+    _: str = Depends(require_auth),
+):
+    """List posts (LinkedIn + blog). refresh=true bypasses the cache."""
+    return _cached_posts(refresh=refresh)
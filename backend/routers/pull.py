@@ -1,19 +1,29 @@
 import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from pydantic import BaseModel
 from typing import Optional
 
-from backend.config import get_supabase_credentials, get_openai_key, PROJECT_ROOT
+from backend.config import get_supabase_credentials, get_supabase_client, get_openai_key, PROJECT_ROOT, KNOWN_CONFIG_IDS, PODCAST_CONFIG_IDS, UNKNOWN_CONFIG_ID_DETAIL
+from backend.core.config_manager import get_user_config
 from backend.routers.auth import require_auth
+from backend.routers.posts import clear_posts_cache
+from backend.routers.transcripts import clear_transcripts_cache
 
 router = APIRouter()
 
-# Store last run output per config_id for GET (optional)
-_last_run: dict = {"output": "", "success": False, "config_id": None}
+# Store last run output per config_id for GET (optional); running is true while a pull task is in flight
+_last_run: dict = {"output": "", "success": False, "config_id": None, "running": False}
+_start_lock = threading.Lock()
+
+# Output of the pull in flight, appended line by line so /status can show progress before it finishes
+_live_output: list = []
+
+PULL_TIMEOUT_SEC = 60 * 30
 
 
 class PullBody(BaseModel):
@@ -23,46 +33,85 @@ class PullBody(BaseModel):
     run_limit: int = 10  # 0 = unlimited
 
 
-def _run_pull_sync(config_id: str, show_id: str, url: str, run_limit: int):
-    """Run backend.core.main with env. Blocks."""
+def _start(background_tasks: BackgroundTasks, task, *args):
+    """Schedule a pull task, refusing to start a second one while the first is still running."""
+    # Sync endpoints run on FastAPI's threadpool, so check-and-set must be atomic
+    with _start_lock:
+        if _last_run["running"]:
+            raise HTTPException(status_code=409, detail="A pull is already running")
+        _last_run["running"] = True
+
+    def tracked():
+        try:
+            task(*args)
+        finally:
+            _last_run["running"] = False
+
+    background_tasks.add_task(tracked)
+
+
+def _base_env() -> dict:
+    """Environment for backend.core.main: ours plus the OpenAI and Supabase credentials, each read once."""
     env = dict(os.environ)
-    env["MAX_EPISODES_PER_RUN"] = "0" if run_limit == 0 else str(run_limit)
-    env["PODCAST_CONFIG_ID"] = config_id
-    if get_openai_key():
-        env["OPENAI_API_KEY"] = get_openai_key()
+    openai_key = get_openai_key()
+    if openai_key:
+        env["OPENAI_API_KEY"] = openai_key
     url_sup, key_sup = get_supabase_credentials()
     if url_sup:
         env["SUPABASE_URL"] = url_sup
     if key_sup:
         env["SUPABASE_SERVICE_ROLE_KEY"] = key_sup
+    return env
+
+
+def _run_core_main(env: dict) -> int:
+    """Run backend.core.main, appending its output to _live_output as it is printed. Returns the exit code."""
+    proc = subprocess.Popen(
+        [sys.executable, "-u", "-m", "backend.core.main"],
+        cwd=str(PROJECT_ROOT),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    # Kill a stuck pull after 30 minutes; a non-zero exit marks the run failed
+    watchdog = threading.Timer(PULL_TIMEOUT_SEC, proc.kill)
+    watchdog.start()
+    try:
+        for line in proc.stdout:
+            _live_output.append(line)
+        return proc.wait()
+    finally:
+        watchdog.cancel()
+        # Only the pulled podcast's transcripts can have changed; posts live in shared tables
+        clear_transcripts_cache(env.get("PODCAST_CONFIG_ID"))
+        clear_posts_cache()
+
+
+def _run_pull_sync(config_id: str, show_id: str, url: str, run_limit: int):
+    """Run backend.core.main with env. Blocks."""
+    env = _base_env()
+    env["MAX_EPISODES_PER_RUN"] = "0" if run_limit == 0 else str(run_limit)
+    env["PODCAST_CONFIG_ID"] = config_id
     if show_id:
         env["SHOW_ID"] = show_id
     if url:
         env["APPLE_EPISODE_URL"] = url
+    _live_output.clear()
+    _last_run["config_id"] = config_id
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "backend.core.main"],
-            cwd=str(PROJECT_ROOT),
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=60 * 30,
-        )
-        out = (result.stdout or "") + "\n" + (result.stderr or "")
-        _last_run["output"] = out
-        _last_run["success"] = result.returncode == 0
-        _last_run["config_id"] = config_id
+        _last_run["success"] = _run_core_main(env) == 0
     except Exception as e:
-        _last_run["output"] = str(e)
+        _live_output.append(f"\n{e}")
         _last_run["success"] = False
-        _last_run["config_id"] = config_id
+    _last_run["output"] = "".join(_live_output)
 
 
 @router.post("/run")
 def run_pull(body: PullBody, background_tasks: BackgroundTasks, _: str = Depends(require_auth)):
     """Trigger pull. Runs in background; use GET /pull/status for output."""
-    if body.config_id not in ("apple", "second_podcast", "twiml", "practical_ai", "a16z", "cognitive_rev", "hard_fork", "lex_fridman", "dwarkesh", "nvidia_ai"):
-        raise HTTPException(status_code=400, detail="config_id must be one of the known podcasts (including lex_fridman, dwarkesh, nvidia_ai)")
+    if body.config_id not in KNOWN_CONFIG_IDS:
+        raise HTTPException(status_code=400, detail=UNKNOWN_CONFIG_ID_DETAIL)
     openai_key = get_openai_key()
     if not openai_key:
         raise HTTPException(status_code=400, detail="OPENAI_API_KEY not configured")
@@ -70,59 +119,37 @@ def run_pull(body: PullBody, background_tasks: BackgroundTasks, _: str = Depends
     url = (body.apple_episode_url or "").strip()
     if not show_id and not url:
         # Load from Supabase config
-        client = None
-        url_sup, key_sup = get_supabase_credentials()
-        if url_sup and key_sup:
-            from backend.core.storage import build_supabase_client
-            from backend.core.config_manager import get_user_config
-            client = build_supabase_client(url_sup, key_sup)
-            if client:
-                cfg = get_user_config(client, config_id=body.config_id)
-                show_id = (cfg.get("show_id") or "").strip()
-                url = (cfg.get("apple_episode_url") or "").strip()
+        client = get_supabase_client()
+        if client:
+            cfg = get_user_config(client, config_id=body.config_id)
+            show_id = (cfg.get("show_id") or "").strip()
+            url = (cfg.get("apple_episode_url") or "").strip()
         if not show_id and not url:
             raise HTTPException(status_code=400, detail="Configure show_id or apple_episode_url first")
-    background_tasks.add_task(_run_pull_sync, body.config_id, show_id, url, body.run_limit)
+    _start(background_tasks, _run_pull_sync, body.config_id, show_id, url, body.run_limit)
     return {"success": True, "message": "Pull started in background", "config_id": body.config_id}
 
 
 def _run_both_sync():
     """Run pull for apple then second_podcast in sequence. Blocks."""
-    env_base = dict(os.environ)
-    if get_openai_key():
-        env_base["OPENAI_API_KEY"] = get_openai_key()
-    url_sup, key_sup = get_supabase_credentials()
-    if url_sup:
-        env_base["SUPABASE_URL"] = url_sup
-    if key_sup:
-        env_base["SUPABASE_SERVICE_ROLE_KEY"] = key_sup
-    out_parts = []
-    for cid in ("apple", "second_podcast", "twiml", "practical_ai", "a16z", "cognitive_rev", "hard_fork", "lex_fridman", "dwarkesh", "nvidia_ai"):
+    env_base = _base_env()
+    _live_output.clear()
+    _last_run["config_id"] = "run_all"
+    success = True
+    for cid in PODCAST_CONFIG_IDS:
         env = dict(env_base)
         env["PODCAST_CONFIG_ID"] = cid
+        _live_output.append(f"=== {cid} ===\n")
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "backend.core.main"],
-                cwd=str(PROJECT_ROOT),
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=60 * 30,
-            )
-            out_parts.append(f"=== {cid} ===\n{(result.stdout or '')}\n{(result.stderr or '')}")
-            if result.returncode != 0:
-                _last_run["output"] = "\n".join(out_parts)
-                _last_run["success"] = False
-                _last_run["config_id"] = "run_all"
-                return
+            if _run_core_main(env) != 0:
+                success = False
+                break
         except Exception as e:
-            _last_run["output"] = "\n".join(out_parts) + "\n" + str(e)
-            _last_run["success"] = False
-            _last_run["config_id"] = "run_all"
-            return
-    _last_run["output"] = "\n".join(out_parts)
-    _last_run["success"] = True
-    _last_run["config_id"] = "run_all"
+            _live_output.append(f"\n{e}")
+            success = False
+            break
+    _last_run["output"] = "".join(_live_output)
+    _last_run["success"] = success
 
 
 @router.post("/run-all")
@@ -130,15 +157,17 @@ def run_pull_all(background_tasks: BackgroundTasks, _: str = Depends(require_aut
     """Run pull for both podcasts (apple then second_podcast) in sequence. Runs in background."""
     if not get_openai_key():
         raise HTTPException(status_code=400, detail="OPENAI_API_KEY not configured")
-    background_tasks.add_task(_run_both_sync)
+    _start(background_tasks, _run_both_sync)
     return {"success": True, "message": "Run all podcasts started in background", "config_id": "run_all"}
 
 
 @router.get("/status")
 def pull_status(_: str = Depends(require_auth)):
-    """Last run output (from any config_id or run_all)."""
+    """Last run output (from any config_id or run_all). Poll while running is true; output grows as the pull prints."""
+    running = _last_run.get("running", False)
     return {
-        "output": _last_run.get("output", ""),
+        "output": "".join(_live_output) if running else _last_run.get("output", ""),
         "success": _last_run.get("success", False),
         "config_id": _last_run.get("config_id"),
+        "running": running,
     }
@@ -0,0 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import APIRouter, Depends
+
+from backend.config import get_supabase_client
+from backend.core.storage import count_rows
+from backend.routers.auth import require_auth
+
+router = APIRouter()
+
+# Each counter is named after the table it counts
+COUNTED_TABLES = ("linkedin_posts", "blog_posts")
+
+
+def _counts():
+    """Row counts per counter; None where the count is unknown (no Supabase client, or the query failed)."""
+    client = get_supabase_client()
+    if not client:
+        return {table: None for table in COUNTED_TABLES}
+    # Each count is its own round-trip; issue them together
+    with ThreadPoolExecutor(max_workers=len(COUNTED_TABLES)) as pool:
+        futures = {table: pool.submit(count_rows, client, table) for table in COUNTED_TABLES}
+    counts = {}
+    for name, future in futures.items():
+        try:
+            counts[name] = future.result()
+        except Exception:
+            counts[name] = None
+    return counts
+
+
+@router.get("")
+def get_stats(_: str = Depends(require_auth)):
+    """Dashboard counters (LinkedIn + blog posts) without loading any rows. A count that could not be read is null."""
+    return _counts()
@@ -1,102 +1,86 @@
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from postgrest.exceptions import APIError
 
-from backend.config import get_supabase_credentials
+from backend.config import TRANSCRIPT_TABLES, get_supabase_client
+from backend.core.dates import parse_iso
 from backend.routers.auth import require_auth
 
 router = APIRouter()
 
-TRANSCRIPTS_TABLE_SECOND = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_SECOND_PODCAST", "latent_space_transcripts")
-TRANSCRIPTS_TABLE_TWIML = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_TWIML", "twiml_transcripts")
-TRANSCRIPTS_TABLE_PRACTICAL_AI = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_PRACTICAL_AI", "practical_ai_transcripts")
-TRANSCRIPTS_TABLE_A16Z = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_A16Z", "a16z_transcripts")
-TRANSCRIPTS_TABLE_COGNITIVE_REV = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_COGNITIVE_REV", "cognitive_revolution_transcripts")
-TRANSCRIPTS_TABLE_HARD_FORK = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_HARD_FORK", "hard_fork_transcripts")
-TRANSCRIPTS_TABLE_LEX_FRIDMAN = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_LEX_FRIDMAN", "lex_fridman_transcripts")
-TRANSCRIPTS_TABLE_DWARKESH = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_DWARKESH", "dwarkesh_transcripts")
-TRANSCRIPTS_TABLE_NVIDIA_AI = os.getenv("SUPABASE_TABLE_TRANSCRIPTS_NVIDIA_AI", "nvidia_ai_transcripts")
+# The list only needs episode metadata; chunk text is fetched per transcript via /content
+TRANSCRIPT_LIST_COLUMNS = "guid, original_guid, title, published_at, created_at"
+TRANSCRIPT_CONTENT_COLUMNS = "chunk_index, transcript_content"
+TRANSCRIPTS_CACHE_TTL = int(os.getenv("TRANSCRIPTS_CACHE_TTL", "300"))
+# Full transcript texts kept in memory at once; least recently opened are evicted first
+TRANSCRIPT_CONTENT_CACHE_SIZE = int(os.getenv("TRANSCRIPT_CONTENT_CACHE_SIZE", "64"))
+
+# config_id -> (expires_at, transcripts) and (config_id, guid) -> (expires_at, content);
+# cleared per podcast by the pull router after each run
+_transcripts_cache: dict = {}
+_content_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+# Request threads fill the caches while the pull task clears them
+_cache_lock = threading.Lock()
+# Bumped by every clear; a load stores its result only if no clear ran while it was in flight
+_cache_state: dict = {"generation": 0}
+
+
+def clear_transcripts_cache(config_id: Optional[str] = None):
+    """Drop cached entries for one podcast (plus the unfiltered list), or everything when config_id is None."""
+    with _cache_lock:
+        _cache_state["generation"] += 1
+        if config_id is None:
+            _transcripts_cache.clear()
+            _content_cache.clear()
+            return
+        for cid in (config_id, None):
+            _transcripts_cache.pop(cid, None)
+        for key in [k for k in _content_cache if k[0] in (config_id, None)]:
+            del _content_cache[key]
+
+
+def _execute(client, config_id: Optional[str], columns: str, build, **select_kwargs):
+    """Run build(query) against the transcript table for config_id and return the response (None on API errors).
+
+    Podcasts without their own table live in podcast_transcripts, filtered by config_id when that column exists.
+    """
+    table = TRANSCRIPT_TABLES.get(config_id)
+    try:
+        if table:
+            return build(client.table(table).select(columns, **select_kwargs)).execute()
+        query = client.table("podcast_transcripts").select(columns, **select_kwargs)
+        if config_id:
+            try:
+                return build(query.eq("config_id", config_id)).execute()
+            except APIError:
+                query = client.table("podcast_transcripts").select(columns, **select_kwargs)
+        return build(query).execute()
+    except APIError:
+        return None
+
+
+def _select_rows(client, config_id: Optional[str], columns: str, build):
+    resp = _execute(client, config_id, columns, build)
+    return (resp.data or []) if resp else []
 
 
 def _load_transcripts(config_id: Optional[str] = None):
-    url, key = get_supabase_credentials()
-    if not url or not key:
-        return []
-    from backend.core.storage import build_supabase_client
-    client = build_supabase_client(url, key)
+    """Transcript metadata grouped by episode guid, newest first. Content is served by _load_transcript_content."""
+    client = get_supabase_client()
     if not client:
         return []
-
-    if config_id == "second_podcast":
-        table = client.table(TRANSCRIPTS_TABLE_SECOND)
-        try:
-            result = table.select("*").order("created_at", desc=True).execute()
-        except APIError:
-            return []
-    elif config_id == "twiml":
-        table = client.table(TRANSCRIPTS_TABLE_TWIML)
-        try:
-            result = table.select("*").order("created_at", desc=True).execute()
-        except APIError:
-            return []
-    elif config_id == "practical_ai":
-        table = client.table(TRANSCRIPTS_TABLE_PRACTICAL_AI)
-        try:
-            result = table.select("*").order("created_at", desc=True).execute()
-        except APIError:
-            return []
-    elif config_id == "a16z":
-        table = client.table(TRANSCRIPTS_TABLE_A16Z)
-        try:
-            result = table.select("*").order("created_at", desc=True).execute()
-        except APIError:
-            return []
-    elif config_id == "cognitive_rev":
-        table = client.table(TRANSCRIPTS_TABLE_COGNITIVE_REV)
-        try:
-            result = table.select("*").order("created_at", desc=True).execute()
-        except APIError:
-            return []
-    elif config_id == "hard_fork":
-        table = client.table(TRANSCRIPTS_TABLE_HARD_FORK)
-        try:
-            result = table.select("*").order("created_at", desc=True).execute()
-        except APIError:
-            return []
-    elif config_id == "lex_fridman":
-        table = client.table(TRANSCRIPTS_TABLE_LEX_FRIDMAN)
-        try:
-            result = table.select("*").order("created_at", desc=True).execute()
-        except APIError:
-            return []
-    elif config_id == "dwarkesh":
-        table = client.table(TRANSCRIPTS_TABLE_DWARKESH)
-        try:
-            result = table.select("*").order("created_at", desc=True).execute()
-        except APIError:
-            return []
-    elif config_id == "nvidia_ai":
-        table = client.table(TRANSCRIPTS_TABLE_NVIDIA_AI)
-        try:
-            result = table.select("*").order("created_at", desc=True).execute()
-        except APIError:
-            return []
-    else:
-        table = client.table("podcast_transcripts")
-        try:
-            if config_id:
-                result = table.select("*").eq("config_id", config_id).order("created_at", desc=True).execute()
-            else:
-                result = table.select("*").order("created_at", desc=True).execute()
-        except APIError:
-            result = table.select("*").order("created_at", desc=True).execute()
-    if not result.data:
+    # Every chunk row repeats the episode metadata; the first chunk alone is enough for the list
+    rows = _select_rows(client, config_id, TRANSCRIPT_LIST_COLUMNS, lambda q: q.eq("chunk_index", 1).order("created_at", desc=True))
+    if not rows:
         return []
     grouped = {}
-    for record in result.data:
+    for record in rows:
         guid = record.get("original_guid") or record.get("guid")
         if guid not in grouped:
             grouped[guid] = {
@@ -104,35 +88,89 @@ def _load_transcripts(config_id: Optional[str] = None):
                 "title": record["title"],
                 "published_at": record.get("published_at"),
                 "created_at": record.get("created_at"),
-                "transcript_content": "",
-                "chunks": [],
             }
-        grouped[guid]["chunks"].append({
-            "chunk_index": record.get("chunk_index", 1),
-            "content": record.get("transcript_content", ""),
-        })
-    final = []
-    for guid, t in grouped.items():
-        t["chunks"].sort(key=lambda x: x["chunk_index"])
-        t["transcript_content"] = "".join(c["content"] for c in t["chunks"])
-        del t["chunks"]
-        final.append(t)
+    final = list(grouped.values())
     def sort_key(item):
-        s = item.get("published_at") or item.get("created_at") or ""
-        if not s:
-            return datetime.min
-        try:
-            if "T" in s:
-                s = s.replace("Z", "+00:00")
-            return datetime.fromisoformat(s)
-        except Exception:
-            return datetime.min
+        return parse_iso(item.get("published_at") or item.get("created_at")) or datetime.min
     final.sort(key=sort_key, reverse=True)
     return final
+
+
+def _load_transcript_content(config_id: Optional[str], guid: str) -> Optional[str]:
+    """Full transcript text for one episode: its chunks joined in chunk_index order, or None if not found."""
+    client = get_supabase_client()
+    if not client:
+        return None
+    # Let Postgres return chunks already in order so they can be joined in one pass
+    rows = _select_rows(client, config_id, TRANSCRIPT_CONTENT_COLUMNS, lambda q: q.eq("original_guid", guid).order("chunk_index"))
+    if not rows:
+        # Rows written before original_guid existed are keyed by guid only
+        rows = _select_rows(client, config_id, TRANSCRIPT_CONTENT_COLUMNS, lambda q: q.eq("guid", guid).order("chunk_index"))
+    if not rows:
+        return None
+    return "".join(r.get("transcript_content") or "" for r in rows)
+
+
+def _cached_transcripts(config_id: Optional[str], refresh: bool = False):
+    """_load_transcripts behind a short TTL cache. Empty results are not cached so a transient failure is retried."""
+    now = time.monotonic()
+    with _cache_lock:
+        hit = _transcripts_cache.get(config_id)
+        generation = _cache_state["generation"]
+    if hit and not refresh and hit[0] > now:
+        return hit[1]
+    transcripts = _load_transcripts(config_id=config_id)
+    with _cache_lock:
+        if _cache_state["generation"] != generation:
+            # A pull cleared the cache mid-load, so this result may predate it: serve it but do not keep it
+            return transcripts
+        if transcripts:
+            _transcripts_cache[config_id] = (now + TRANSCRIPTS_CACHE_TTL, transcripts)
+        else:
+            _transcripts_cache.pop(config_id, None)
+    return transcripts
+
+
+def _cached_transcript_content(config_id: Optional[str], guid: str) -> Optional[str]:
+    now = time.monotonic()
+    key = (config_id, guid)
+    with _cache_lock:
+        hit = _content_cache.get(key)
+        if hit and hit[0] > now:
+            _content_cache.move_to_end(key)
+            return hit[1]
+        # Expired entries are dropped on access rather than left holding their text
+        _content_cache.pop(key, None)
+        generation = _cache_state["generation"]
+    content = _load_transcript_content(config_id, guid)
+    if content is not None:
+        with _cache_lock:
+            if _cache_state["generation"] != generation:
+                return content
+            _content_cache[key] = (now + TRANSCRIPTS_CACHE_TTL, content)
+            while len(_content_cache) > TRANSCRIPT_CONTENT_CACHE_SIZE:
+                _content_cache.popitem(last=False)
+    return content
+
+
 @router.get("")
 def list_transcripts(
+    config_id: Optional[str] = Query(None),
+    refresh: bool = Query(False),
+    _: str = Depends(require_auth),
+):
+    """List transcript metadata (grouped by guid) for a given config_id (podcast) if provided. refresh=true bypasses the cache."""
+    return _cached_transcripts(config_id, refresh=refresh)
+
+
+@router.get("/content")
+def get_transcript_content(
+    guid: str = Query(...),
     config_id: Optional[str] = Query(None),
     _: str = Depends(require_auth),
 ):
-    """List all transcripts (grouped by guid) for a given config_id (podcast) if provided."""
-    return _load_transcripts(config_id=config_id)
+    """Full text of one transcript (chunks joined). Loaded on demand when an episode is opened."""
+    content = _cached_transcript_content(config_id, guid)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Transcript not found")
+    return {"guid": guid, "transcript_content": content}
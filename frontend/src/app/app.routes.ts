@@ -1,8 +1,8 @@
 import { Routes } from '@angular/router';
-import { authGuard } from './guards/auth.guard';
+import { authGuard, guestGuard } from './guards/auth.guard';
 
 export const routes: Routes = [
-  { path: 'login', loadComponent: () => import('./components/login/login.component').then((m) => m.LoginComponent) },
+  { path: 'login', loadComponent: () => import('./components/login/login.component').then((m) => m.LoginComponent), canActivate: [guestGuard] },
   { path: '', loadComponent: () => import('./components/dashboard/dashboard.component').then((m) => m.DashboardComponent), canActivate: [authGuard] },
   { path: '**', redirectTo: '' },
 ];
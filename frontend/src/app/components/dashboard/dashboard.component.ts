@@ -1,8 +1,8 @@
-import { Component, signal, computed, OnInit } from '@angular/core';
+import { ChangeDetectionStrategy, Component, signal, computed, OnInit } from '@angular/core';
 import { CommonModule } from '@angular/common';
 import { FormsModule } from '@angular/forms';
 import { AuthService } from '../../services/auth.service';
-import { ApiService, PodcastConfig, Transcript, Post } from '../../services/api.service';
+import { ApiService, PodcastConfig, Transcript, Stats } from '../../services/api.service';
 
 export type PodcastTab = 'apple' | 'second_podcast' | 'twiml' | 'practical_ai' | 'a16z' | 'cognitive_rev' | 'hard_fork' | 'lex_fridman' | 'dwarkesh' | 'nvidia_ai';
 
@@ -11,10 +11,18 @@ interface PodcastTabItem {
   label: string;
 }
 
+/** Display strings for one sidebar row, computed once per transcript list. */
+interface EpisodeRow {
+  transcript: Transcript;
+  title: string;
+  date: string;
+}
+
 interface TabCache {
   config?: PodcastConfig | null;
   transcripts?: Transcript[];
-  posts?: Post[];
+  /** Date.now() when transcripts were last fetched for this tab. */
+  loadedAt?: number;
 }
 
 const PODCAST_TABS: PodcastTabItem[] = [
@@ -30,20 +38,34 @@ const PODCAST_TABS: PodcastTabItem[] = [
   { id: 'nvidia_ai', label: 'NVIDIA AI' },
 ];
 
+/** How often to re-check /api/pull/status while a pull is running. */
+const PULL_POLL_MS = 3000;
+
+/** A tab revisited within this window is shown from cache without refetching. */
+const TAB_REFRESH_MS = 60_000;
+
+/** Transcript texts kept in memory at once; the least recently opened is dropped first. */
+const CONTENT_CACHE_SIZE = 20;
+
+const MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'];
+
 @Component({
   selector: 'app-dashboard',
   standalone: true,
   imports: [CommonModule, FormsModule],
   templateUrl: './dashboard.component.html',
   styleUrl: './dashboard.component.css',
+  // Template state is all signals, so only re-check when one of them changes
+  changeDetection: ChangeDetectionStrategy.OnPush,
 })
 export class DashboardComponent implements OnInit {
   currentPodcast = signal<PodcastTab>('apple');
   config = signal<PodcastConfig | null>(null);
   transcripts = signal<Transcript[]>([]);
-  posts = signal<Post[]>([]);
+  stats = signal<Stats | null>(null);
   pullOutput = signal('');
   pullSuccess = signal(false);
+  pullRunning = signal(false);
   loading = signal(false);
   error = signal('');
   saving = signal(false);
@@ -58,11 +80,24 @@ export class DashboardComponent implements OnInit {
   runLimit = 10;
   voice = 'Professional, friendly';
   instructions = '';
-  selectedTranscript: Transcript | null = null;
-  selectedTranscriptGuid = '';
+  selectedTranscript = signal<Transcript | null>(null);
+  selectedTranscriptGuid = computed(() => this.selectedTranscript()?.guid ?? '');
+  /** Detail-pane date; same label as the sidebar row, computed once per selection. */
+  selectedDate = computed(() => {
+    const t = this.selectedTranscript();
+    return t ? this.formatTranscriptDate(t) : '';
+  });
+  /** Full text of the selected transcript; null while it is being fetched. */
+  selectedContent = signal<string | null>(null);
+  /** Set when the selected transcript's text could not be fetched; selecting it again retries. */
+  contentUnavailable = signal(false);
   showMobileMenu = signal(false);
 
   readonly podcastTabs = PODCAST_TABS;
+  /** Recently fetched transcript text keyed by `${tab}:${guid}`; Map insertion order doubles as LRU order. */
+  private contentCache = new Map<string, string>();
+  /** Formatted dates keyed by the raw timestamp; lists are re-fetched per tab but their dates rarely change. */
+  private dateLabels = new Map<string, string>();
   private cache: Record<PodcastTab, TabCache | null> = PODCAST_TABS.reduce((acc, p) => ({ ...acc, [p.id]: null }), {} as Record<PodcastTab, TabCache | null>);
 
   constructor(
@@ -72,9 +107,11 @@ export class DashboardComponent implements OnInit {
 
   ngOnInit(): void {
     this.loading.set(true);
-    this.loadConfig();
+    // The episode list is what the first paint waits on, so request it first.
     this.loadTranscripts();
-    this.loadPosts();
+    this.loadConfig();
+    this.loadStats();
+    // One status check picks up a pull started before this page load; it only keeps polling while running
     this.loadPullStatus();
   }
 
@@ -86,21 +123,25 @@ export class DashboardComponent implements OnInit {
     if (cached?.transcripts && cached.transcripts.length > 0) {
       // Instant display from cache, then refresh in background
       this.transcripts.set(cached.transcripts);
-      this.selectedTranscript = cached.transcripts[0];
-      this.selectedTranscriptGuid = cached.transcripts[0].guid;
+      this.showTranscript(cached.transcripts[0]);
       this.loading.set(false);
     } else {
       // No cache yet: clear and show spinner until fresh data loads
-      this.selectedTranscript = null;
-      this.selectedTranscriptGuid = '';
+      this.showTranscript(null);
       this.transcripts.set([]);
       this.loading.set(true);
     }
 
-    // Always reload config + posts + transcripts (transcripts may be a fast refresh)
+    const fresh = !!cached?.transcripts?.length && Date.now() - (cached.loadedAt ?? 0) < TAB_REFRESH_MS;
+    if (fresh && cached!.config !== undefined) {
+      // Seen moments ago: reuse what we have instead of refetching on every tab click
+      this.applyConfig(cached!.config);
+      return;
+    }
+
+    // Reload the tab's config + transcripts (transcripts may be a fast refresh).
     this.loadConfig();
     this.loadTranscripts();
-    this.loadPosts();
   }
 
   loadConfig(): void {
@@ -109,12 +150,7 @@ export class DashboardComponent implements OnInit {
       next: (c) => {
         if (!this.cache[tab]) this.cache[tab] = {};
         this.cache[tab]!.config = c;
-        if (this.currentPodcast() === tab) {
-          this.config.set(c);
-          this.showId = c?.show_id ?? '';
-          this.appleUrl = c?.apple_episode_url ?? '';
-          this.maxEpisodes = c?.max_episodes_per_run ?? 10;
-        }
+        if (this.currentPodcast() === tab) this.applyConfig(c);
         this.error.set('');
       },
       error: () => {
@@ -123,9 +159,25 @@ export class DashboardComponent implements OnInit {
     });
   }
 
+  /** Post counts, counted server-side. They are not per podcast, so tab switches keep the last ones. */
+  loadStats(): void {
+    this.api.getStats().subscribe({
+      next: (st) => this.stats.set(st),
+      error: () => this.stats.set(null),
+    });
+  }
+
+  private applyConfig(c: PodcastConfig | null): void {
+    this.config.set(c);
+    this.showId = c?.show_id ?? '';
+    this.appleUrl = c?.apple_episode_url ?? '';
+    this.maxEpisodes = c?.max_episodes_per_run ?? 10;
+  }
+
   saveConfig(): void {
     this.saving.set(true);
-    this.api.putConfig(this.currentPodcast(), {
+    const tab = this.currentPodcast();
+    this.api.putConfig(tab, {
       show_id: this.showId,
       apple_episode_url: this.appleUrl,
       max_episodes_per_run: this.maxEpisodes,
@@ -133,6 +185,8 @@ export class DashboardComponent implements OnInit {
       next: () => {
         this.saving.set(false);
         this.error.set('');
+        // Drop the cached copy so the next visit to this tab refetches the saved config
+        if (this.cache[tab]) this.cache[tab]!.loadedAt = 0;
       },
       error: () => {
         this.saving.set(false);
@@ -177,8 +231,19 @@ export class DashboardComponent implements OnInit {
   loadPullStatus(): void {
     this.api.getPullStatus().subscribe({
       next: (s) => {
+        const finished = this.pullRunning() && !s.running;
         this.pullOutput.set(s.output);
         this.pullSuccess.set(s.success);
+        this.pullRunning.set(s.running);
+        if (s.running) {
+          setTimeout(() => this.loadPullStatus(), PULL_POLL_MS);
+        } else if (finished) {
+          // The pull may have added or re-stored episodes and posts; the server dropped its caches too
+          for (const p of PODCAST_TABS) if (this.cache[p.id]) this.cache[p.id]!.loadedAt = 0;
+          this.contentCache.clear();
+          this.loadTranscripts();
+          this.loadStats();
+        }
       },
     });
   }
@@ -189,15 +254,10 @@ export class DashboardComponent implements OnInit {
       next: (t) => {
         if (!this.cache[tab]) this.cache[tab] = {};
         this.cache[tab]!.transcripts = t;
+        this.cache[tab]!.loadedAt = Date.now();
         if (this.currentPodcast() === tab) {
           this.transcripts.set(t);
-          if (t.length > 0) {
-            this.selectedTranscript = t[0];
-            this.selectedTranscriptGuid = t[0].guid;
-          } else {
-            this.selectedTranscript = null;
-            this.selectedTranscriptGuid = '';
-          }
+          this.showTranscript(t[0] ?? null);
         }
         this.loading.set(false);
       },
@@ -208,33 +268,47 @@ export class DashboardComponent implements OnInit {
     });
   }
 
-  loadPosts(): void {
+  selectTranscript(t: Transcript): void {
+    this.showTranscript(t);
+  }
+
+  /** Select a transcript and fetch its text; the list endpoint only returns metadata. */
+  private showTranscript(t: Transcript | null): void {
+    const unchanged = !!t && t.guid === this.selectedTranscriptGuid() && this.selectedContent() !== null;
+    this.selectedTranscript.set(t);
+    if (unchanged) return;
+    this.selectedContent.set(null);
+    this.contentUnavailable.set(false);
+    if (!t) return;
     const tab = this.currentPodcast();
-    this.api.getPosts().subscribe({
-      next: (p) => {
-        if (!this.cache[tab]) this.cache[tab] = {};
-        this.cache[tab]!.posts = p;
-        if (this.currentPodcast() === tab) this.posts.set(p);
+    const key = `${tab}:${t.guid}`;
+    const cached = this.contentCache.get(key);
+    if (cached !== undefined) {
+      // Re-insert to mark it most recently used
+      this.contentCache.delete(key);
+      this.contentCache.set(key, cached);
+      this.selectedContent.set(cached);
+      return;
+    }
+    this.api.getTranscriptContent(tab, t.guid).subscribe({
+      next: (c) => {
+        this.contentCache.set(key, c.transcript_content);
+        if (this.contentCache.size > CONTENT_CACHE_SIZE) {
+          this.contentCache.delete(this.contentCache.keys().next().value!);
+        }
+        if (this.selectedTranscriptGuid() === t.guid) this.selectedContent.set(c.transcript_content);
       },
       error: () => {
-        if (this.currentPodcast() === tab) this.posts.set([]);
+        // Failures are not cached, so the next selection of this episode fetches it again
+        if (this.selectedTranscriptGuid() === t.guid) this.contentUnavailable.set(true);
       },
     });
   }
 
-  selectTranscript(t: Transcript): void {
-    this.selectedTranscript = t;
-    this.selectedTranscriptGuid = t?.guid ?? '';
-  }
-
-  onSelectTranscriptGuid(guid: string): void {
-    this.selectedTranscriptGuid = guid;
-    this.selectedTranscript = this.transcripts().find((x) => x.guid === guid) ?? null;
-  }
-
   copyTranscript(): void {
-    if (!this.selectedTranscript?.transcript_content) return;
-    navigator.clipboard.writeText(this.selectedTranscript.transcript_content).then(() => {
+    const content = this.selectedContent();
+    if (!content) return;
+    navigator.clipboard.writeText(content).then(() => {
       this.copyDone.set(true);
       setTimeout(() => this.copyDone.set(false), 2000);
     }).catch(() => {});
@@ -244,59 +318,68 @@ export class DashboardComponent implements OnInit {
   formatTranscriptDate(t: Transcript): string {
     const raw = t.published_at || t.created_at || '';
     if (!raw) return 'Unknown date';
-    try {
-      const s = raw.replace('Z', '+00:00');
-      const d = new Date(s);
-      if (isNaN(d.getTime())) return raw;
-      const months = ['January','February','March','April','May','June','July','August','September','October','November','December'];
-      return `${months[d.getMonth()]} - ${d.getDate()} - ${d.getFullYear()}`;
-    } catch {
-      return raw;
+    let label = this.dateLabels.get(raw);
+    if (label === undefined) {
+      label = this.parseDateLabel(raw);
+      this.dateLabels.set(raw, label);
     }
+    return label;
   }
 
-  /** Truncate title for list display */
-  transcriptListLabel(t: Transcript): string {
-    const title = t.title.length > 60 ? t.title.slice(0, 57) + '...' : t.title;
-    return `${title} (${this.formatTranscriptDate(t)})`;
+  /** new Date() signals bad input with an invalid date rather than throwing, so no try/catch is needed. */
+  private parseDateLabel(raw: string): string {
+    const d = new Date(raw);
+    if (isNaN(d.getTime())) return raw;
+    return `${MONTHS[d.getMonth()]} - ${d.getDate()} - ${d.getFullYear()}`;
   }
 
   generateLinkedIn(): void {
-    if (!this.selectedTranscript) return;
+    const t = this.selectedTranscript();
+    if (!t) return;
     this.generating.set(true);
     this.api.generateLinkedIn(
-      this.selectedTranscript.guid,
-      this.selectedTranscript.title,
-      this.selectedTranscript.published_at || '',
+      t.guid,
+      t.title,
+      t.published_at || '',
       this.voice,
       this.instructions
     ).subscribe({
       next: () => {
         this.generating.set(false);
-        this.loadPosts();
+        // The new post changes the sidebar's post counts
+        this.loadStats();
       },
       error: () => this.generating.set(false),
     });
   }
 
   generateBlog(): void {
-    if (!this.selectedTranscript) return;
+    const t = this.selectedTranscript();
+    if (!t) return;
     this.generating.set(true);
     this.api.generateBlog(
-      this.selectedTranscript.guid,
-      this.selectedTranscript.title,
-      this.selectedTranscript.published_at || '',
+      t.guid,
+      t.title,
+      t.published_at || '',
       this.voice,
       this.instructions
     ).subscribe({
       next: () => {
         this.generating.set(false);
-        this.loadPosts();
+        // The new post changes the sidebar's post counts
+        this.loadStats();
       },
       error: () => this.generating.set(false),
     });
   }
 
-  linkedinPosts = computed(() => this.posts().filter((p) => p.post_type === 'linkedin'));
-  blogPosts = computed(() => this.posts().filter((p) => p.post_type === 'blog'));
+  latestGuid = computed(() => this.transcripts()[0]?.guid ?? '');
+
+  episodeRows = computed<EpisodeRow[]>(() =>
+    this.transcripts().map((t) => ({
+      transcript: t,
+      title: t.title.length > 50 ? t.title.slice(0, 47) + '…' : t.title,
+      date: this.formatTranscriptDate(t),
+    }))
+  );
 }
@@ -3,9 +3,13 @@ import { Router, CanActivateFn } from '@angular/router';
 import { AuthService } from '../services/auth.service';
 
 export const authGuard: CanActivateFn = () => {
-  const auth = inject(AuthService);
-  const router = inject(Router);
-  if (auth.isAuthenticated()) return true;
-  router.navigate(['/login']);
-  return false;
+  if (inject(AuthService).isAuthenticated()) return true;
+  // Redirect as part of this navigation instead of cancelling it and starting a second one
+  return inject(Router).createUrlTree(['/login']);
+};
+
+/** Keeps a signed-in user off /login without loading and rendering the login page first. */
+export const guestGuard: CanActivateFn = () => {
+  if (!inject(AuthService).isAuthenticated()) return true;
+  return inject(Router).createUrlTree(['/']);
 };
@@ -2,20 +2,19 @@ import { HttpInterceptorFn, HttpErrorResponse } from '@angular/common/http';
 import { inject } from '@angular/core';
 import { catchError, throwError } from 'rxjs';
 import { AuthService } from '../services/auth.service';
-import { Router } from '@angular/router';
 
 export const authInterceptor: HttpInterceptorFn = (req, next) => {
   const auth = inject(AuthService);
-  const router = inject(Router);
   const token = auth.getToken();
   const cloned = token
     ? req.clone({ setHeaders: { Authorization: `Bearer ${token}` } })
     : req;
   return next(cloned).pipe(
     catchError((err: HttpErrorResponse) => {
-      if (err.status === 401) {
+      // The dashboard fires several requests at once; only the first 401 logs out
+      // (logout() already navigates to /login).
+      if (err.status === 401 && auth.isAuthenticated()) {
         auth.logout();
-        router.navigate(['/login']);
       }
       return throwError(() => err);
     })
@@ -2,7 +2,6 @@ import { Injectable } from '@angular/core';
 import { HttpClient, HttpParams } from '@angular/common/http';
 import { Observable } from 'rxjs';
 import { environment } from '../../environments/environment';
-import { AuthService } from './auth.service';
 
 export interface PodcastConfig {
   show_id: string;
@@ -15,6 +14,10 @@ export interface Transcript {
   title: string;
   published_at?: string;
   created_at?: string;
+}
+
+export interface TranscriptContent {
+  guid: string;
   transcript_content: string;
 }
 
@@ -28,61 +31,57 @@ export interface Post {
   created_at?: string;
 }
 
+/** Server-side row counts from /api/stats; null when the server could not read a count. */
+export interface Stats {
+  linkedin_posts: number | null;
+  blog_posts: number | null;
+}
+
 export interface PullStatus {
   output: string;
   success: boolean;
   config_id: string | null;
+  running: boolean;
 }
 
 @Injectable({ providedIn: 'root' })
 export class ApiService {
-  constructor(
-    private http: HttpClient,
-    private auth: AuthService
-  ) {
+  // Authorization is attached once per request by authInterceptor.
+  constructor(private http: HttpClient) {
     // eslint-disable-next-line no-console
     console.log('ApiService: using apiUrl', environment.apiUrl);
   }
 
-  private options() {
-    return { headers: this.auth.authHeaders() };
-  }
-
   getConfig(configId: 'apple' | 'second_podcast' | 'twiml' | 'practical_ai' | 'a16z' | 'cognitive_rev' | 'hard_fork' | 'lex_fridman' | 'dwarkesh' | 'nvidia_ai'): Observable<PodcastConfig> {
     return this.http.get<PodcastConfig>(
-      `${environment.apiUrl}/api/config/${configId}`,
-      this.options()
+      `${environment.apiUrl}/api/config/${configId}`
     );
   }
 
   putConfig(configId: 'apple' | 'second_podcast' | 'twiml' | 'practical_ai' | 'a16z' | 'cognitive_rev' | 'hard_fork' | 'lex_fridman' | 'dwarkesh' | 'nvidia_ai', body: PodcastConfig): Observable<{ success: boolean }> {
     return this.http.put<{ success: boolean }>(
       `${environment.apiUrl}/api/config/${configId}`,
-      body,
-      this.options()
+      body
     );
   }
 
   runPull(configId: string, showId?: string, appleEpisodeUrl?: string, runLimit: number = 10): Observable<{ success: boolean; config_id: string }> {
     return this.http.post<{ success: boolean; config_id: string }>(
       `${environment.apiUrl}/api/pull/run`,
-      { config_id: configId, show_id: showId, apple_episode_url: appleEpisodeUrl, run_limit: runLimit },
-      this.options()
+      { config_id: configId, show_id: showId, apple_episode_url: appleEpisodeUrl, run_limit: runLimit }
     );
   }
 
   runPullAll(): Observable<{ success: boolean; config_id: string }> {
     return this.http.post<{ success: boolean; config_id: string }>(
       `${environment.apiUrl}/api/pull/run-all`,
-      {},
-      this.options()
+      {}
     );
   }
 
   getPullStatus(): Observable<PullStatus> {
     return this.http.get<PullStatus>(
-      `${environment.apiUrl}/api/pull/status`,
-      this.options()
+      `${environment.apiUrl}/api/pull/status`
     );
   }
 
@@ -93,14 +92,25 @@ export class ApiService {
     }
     return this.http.get<Transcript[]>(
       `${environment.apiUrl}/api/transcripts`,
-      { ...this.options(), params }
+      { params }
+    );
+  }
+
+  getStats(): Observable<Stats> {
+    return this.http.get<Stats>(`${environment.apiUrl}/api/stats`);
+  }
+
+  getTranscriptContent(configId: string, guid: string): Observable<TranscriptContent> {
+    const params = new HttpParams().set('config_id', configId).set('guid', guid);
+    return this.http.get<TranscriptContent>(
+      `${environment.apiUrl}/api/transcripts/content`,
+      { params }
     );
   }
 
   getPosts(): Observable<Post[]> {
     return this.http.get<Post[]>(
-      `${environment.apiUrl}/api/posts`,
-      this.options()
+      `${environment.apiUrl}/api/posts`
     );
   }
 
@@ -113,8 +123,7 @@ export class ApiService {
         published_at: publishedAt || undefined,
         voice,
         instructions,
-      },
-      this.options()
+      }
     );
   }
 
@@ -127,8 +136,7 @@ export class ApiService {
         published_at: publishedAt || undefined,
         voice,
         instructions,
-      },
-      this.options()
+      }
     );
   }
 }
@@ -43,9 +43,4 @@ export class AuthService {
     this.token.set(null);
     this.router.navigate(['/login']);
   }
-
-  authHeaders(): { [key: string]: string } {
-    const t = this.token();
-    return t ? { Authorization: `Bearer ${t}` } : {};
-  }
 }